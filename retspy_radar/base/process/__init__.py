@@ -1,2 +1,3 @@
+from .rate_limiter import RateLimiter as RateLimiter
 from .sleep import ProcessSleep as ProcessSleep
 from .timer import ProcessTimer as ProcessTimer
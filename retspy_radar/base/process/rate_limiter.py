@@ -0,0 +1,125 @@
+import time
+from threading import Lock
+
+
+class RateLimiter:
+    """
+    Limitador de tasa de solicitudes de cubeta de fichas.
+
+    Implementa el algoritmo de cubeta de fichas («token bucket»): la
+    cubeta acumula fichas a una tasa fija hasta su capacidad máxima, y
+    cada solicitud consume una ficha. Permite ráfagas de hasta
+    `capacity` solicitudes y sólo espera el tiempo mínimo necesario
+    hasta disponer de una ficha, en lugar de aplicar una espera fija
+    antes de cada solicitud. Puede compartirse entre varios hilos.
+
+    La tasa se adapta a la salud del servidor: cada rechazo por exceso
+    de solicitudes la reduce a la mitad, y una ventana de solicitudes
+    exitosas la restituye gradualmente hasta la tasa configurada.
+
+    Methods
+    -------
+    acquire() -> None
+        Consume una ficha, esperando lo mínimo necesario.
+    penalize() -> None
+        Reduce la tasa tras un rechazo del servidor.
+    reward() -> None
+        Anota una solicitud exitosa y restituye la tasa gradualmente.
+    """
+
+    # Número de solicitudes exitosas consecutivas tras el cual la tasa
+    # penalizada se duplica hacia la tasa configurada
+
+    RECOVERY_SUCCESSES: int = 200
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """
+        Inicializa una nueva instancia de la clase RateLimiter.
+
+        Parameters
+        ----------
+        rate : float
+            La tasa de reposición de fichas en fichas por segundo. Si
+            es cero o negativa, no se limita la tasa de solicitudes.
+        capacity : float, optional
+            El número máximo de fichas acumulables; determina el tamaño
+            de las ráfagas permitidas, por defecto es 1.
+        """
+        self._rate: float = rate
+        self._base_rate: float = rate
+        self._capacity: float = max(1.0, capacity)
+        self._tokens: float = self._capacity
+        self._last_refill: float = time.monotonic()
+        self._successes: int = 0
+        self._lock: Lock = Lock()
+
+    def acquire(self) -> None:
+        """
+        Consume una ficha, esperando lo mínimo necesario.
+
+        Si hay fichas disponibles, retorna de inmediato; en caso
+        contrario, espera sólo el tiempo restante hasta que la tasa de
+        reposición provea la siguiente ficha.
+        """
+        if self._rate <= 0.0:
+            return
+
+        wait_time: float
+
+        with self._lock:
+            # Reponer las fichas acumuladas desde la última reposición
+
+            now: float = time.monotonic()
+
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._rate,
+            )
+
+            # Consumir una ficha o anotar el momento en que estará
+            # disponible la siguiente ficha
+
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._last_refill = now
+
+                wait_time = 0.0
+
+            else:
+                wait_time = (1.0 - self._tokens) / self._rate
+
+                self._tokens = 0.0
+                self._last_refill = now + wait_time
+
+        if wait_time > 0.0:
+            time.sleep(wait_time)
+
+    def penalize(self) -> None:
+        """
+        Reduce la tasa tras un rechazo del servidor.
+
+        Reduce la tasa de solicitudes a la mitad y vacía la cubeta de
+        fichas, en respuesta a un rechazo por exceso de solicitudes
+        (HTTP 429). Si el limitador no estaba limitando, comienza a
+        hacerlo con una tasa de una solicitud por segundo.
+        """
+        with self._lock:
+            self._rate = self._rate / 2.0 if self._rate > 0.0 else 1.0
+            self._tokens = 0.0
+            self._last_refill = time.monotonic()
+            self._successes = 0
+
+    def reward(self) -> None:
+        """
+        Anota una solicitud exitosa y restituye la tasa gradualmente.
+
+        Tras `RECOVERY_SUCCESSES` solicitudes exitosas consecutivas, la
+        tasa penalizada se duplica, sin superar la tasa configurada.
+        """
+        with self._lock:
+            if 0.0 < self._rate < self._base_rate:
+                self._successes += 1
+
+                if self._successes >= self.RECOVERY_SUCCESSES:
+                    self._rate = min(self._base_rate, self._rate * 2.0)
+                    self._successes = 0
@@ -4,6 +4,11 @@ import time
 class ProcessSleep:
     """
     Clase para simular un proceso de espera.
+
+    La espera está anclada a plazos absolutos: cada ejecución programa
+    el plazo de la siguiente, de modo que las ejecuciones posteriores
+    sólo duermen el tiempo restante hasta ese plazo, descontando el
+    tiempo ya transcurrido desde la ejecución anterior.
     """
 
     def __init__(self, sleep_time: float) -> None:
@@ -16,9 +21,25 @@ class ProcessSleep:
             El tiempo de espera en segundos.
         """
         self.sleep_time: float = sleep_time
+        self._next_deadline: float | None = None
 
     def run(self) -> None:
         """
         Ejecuta el proceso de espera.
+
+        La primera ejecución espera el intervalo completo; las
+        siguientes esperan sólo hasta el próximo plazo, por lo que la
+        espera es nula si ya transcurrió más de un intervalo desde la
+        ejecución anterior.
         """
-        time.sleep(self.sleep_time)
+        wait_time: float
+
+        if self._next_deadline is None:
+            wait_time = self.sleep_time
+        else:
+            wait_time = max(0.0, self._next_deadline - time.monotonic())
+
+        if wait_time > 0.0:
+            time.sleep(wait_time)
+
+        self._next_deadline = time.monotonic() + self.sleep_time
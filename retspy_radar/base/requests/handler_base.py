@@ -1,3 +1,6 @@
+from requests import Response
+from requests.exceptions import RequestException
+
 from .request_base import RequestBase
 
 
@@ -10,6 +13,11 @@ class RequestsHandlerBase:
     _request : RequestsBase
         Objeto para realizar solicitudes HTTP.
 
+    Methods
+    -------
+    _error_status(exc) -> int
+        Obtiene el código de estado HTTP asociado a una excepción.
+
     Properties
     ----------
     request : RequestsBase
@@ -18,6 +26,8 @@ class RequestsHandlerBase:
         Obtiene el código de estado de la última solicitud HTTP.
     """
 
+    __slots__ = ("_request",)
+
     def __init__(self, request: RequestBase | None = None) -> None:
         """
         Inicializa una nueva instancia del manejador de solicitudes.
@@ -29,6 +39,31 @@ class RequestsHandlerBase:
         """
         self._request: RequestBase = request or RequestBase()
 
+    @staticmethod
+    def _error_status(exc: RequestException) -> int:
+        """
+        Obtiene el código de estado HTTP asociado a una excepción.
+
+        Retorna el código de estado de la respuesta adjunta a la
+        excepción, o cero si la excepción no lleva una respuesta. El
+        código se toma de la propia excepción y no del estado del
+        objeto de solicitudes, que otro hilo puede sobrescribir entre
+        el fallo y su manejo cuando las solicitudes son concurrentes.
+
+        Parameters
+        ----------
+        exc : RequestException
+            La excepción lanzada por la solicitud HTTP.
+
+        Returns
+        -------
+        int
+            El código de estado HTTP, o cero si no está disponible.
+        """
+        response: Response | None = exc.response
+
+        return response.status_code if response is not None else 0
+
     @property
     def request(self) -> RequestBase:
         """
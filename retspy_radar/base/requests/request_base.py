@@ -1,6 +1,8 @@
 from typing import Any, Callable
 
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class RequestBase:
@@ -43,6 +45,24 @@ class RequestBase:
         Obtiene el código de estado de la última solicitud HTTP.
     """
 
+    # Tamaños del repositorio de conexiones de la sesión; las
+    # conexiones se mantienen vivas y se reutilizan entre solicitudes
+    # al mismo servidor, evitando repetir el saludo TCP/TLS
+
+    POOL_CONNECTIONS: int = 8
+    POOL_MAXSIZE: int = 32
+
+    # Política de reintentos ante errores transitorios del servidor;
+    # aplica una espera exponencial entre intentos y respeta la
+    # cabecera "Retry-After" si el servidor la envía. Los rechazos por
+    # exceso de solicitudes (HTTP 429) no se reintentan en esta capa:
+    # los gestiona el limitador de tasa adaptativo del robot, que debe
+    # observar el código 429 en la excepción resultante
+
+    RETRY_TOTAL: int = 3
+    RETRY_BACKOFF_FACTOR: float = 0.5
+    RETRY_STATUS_FORCELIST: tuple[int, ...] = (500, 502, 503, 504)
+
     def __init__(
         self, base_url: str = "", headers: dict[str, Any] | None = None
     ) -> None:
@@ -61,6 +81,20 @@ class RequestBase:
         self._session = Session()
         self._status_code: int = 0
 
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=self.RETRY_TOTAL,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                status_forcelist=self.RETRY_STATUS_FORCELIST,
+                allowed_methods=("GET", "HEAD"),
+            ),
+        )
+
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
     def close(self) -> None:
         """
         Cierra la sesión de solicitudes.
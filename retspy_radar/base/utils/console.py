@@ -7,9 +7,20 @@ class console:
     YES_NO: list[str] = [YES, NO]
     YES_NO_CANCEL: list[str] = [YES, NO, CANCEL]
 
-    @staticmethod
-    def response_is(response: str, expected: str) -> bool:
-        return response.strip().lower() == expected.strip().lower()
+    # Formas canónicas precalculadas de las respuestas esperadas, para
+    # no normalizar las constantes en cada comparación
+
+    _CANONICAL: dict[str, str] = {
+        option: option.strip().lower() for option in (YES, NO, CANCEL)
+    }
+
+    @classmethod
+    def response_is(cls, response: str, expected: str) -> bool:
+        canonical: str = (
+            cls._CANONICAL.get(expected) or expected.strip().lower()
+        )
+
+        return response.strip().lower() == canonical
 
     @staticmethod
     def prompt(question: str, expect: list[str]) -> str:
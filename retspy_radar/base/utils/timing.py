@@ -39,6 +39,13 @@ class timing:
         timedelta.
     """
 
+    # Patrón para extraer los componentes de la duración, compilado una
+    # única vez al cargar la clase
+
+    TD_PATTERN: re.Pattern[str] = re.compile(
+        r"P(?:(\d+)D)?T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?(?:(\d+)m)?"
+    )
+
     UNIT_MAPPING: dict[str, float] = {
         "millisecond": 1e-3,
         "second": 1,
@@ -219,8 +226,8 @@ class timing:
 
         return dt.astimezone(timezone.utc)
 
-    @staticmethod
-    def parse_timedelta(td_str: str) -> timedelta:
+    @classmethod
+    def parse_timedelta(cls, td_str: str) -> timedelta:
         """
         Convierte una cadena de intervalo de tiempo en un objeto
         timedelta.
@@ -244,12 +251,7 @@ class timing:
         TimeConversionError
             Si el valor numérico en el rango de tiempo es inválido.
         """
-        # Patrón para extraer los componentes de la duración
-        TD_PATTERN: str = (
-            r"P(?:(\d+)D)?T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?(?:(\d+)m)?"
-        )
-
-        match: Match[str] | None = re.match(TD_PATTERN, td_str)
+        match: Match[str] | None = cls.TD_PATTERN.match(td_str)
 
         if not match:
             raise InvalidTimeFormatError(
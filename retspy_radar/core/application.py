@@ -16,6 +16,11 @@ from ..sinarame import RobotSMN
 
 
 class Application:
+
+    _ROBOTS: tuple[type[RobotBasic], ...] = (RobotSMN,)
+
+    __slots__ = ("_cached_logger", "_settings")
+
     def __init__(self, settings: SettingsBasic) -> None:
         """
         Inicializa la aplicación.
@@ -27,9 +32,28 @@ class Application:
         logger : Logger
             El registro de eventos de la aplicación.
         """
-        self._logger: Logger = get_logger(pkg_info.name)
+        self._cached_logger: Logger | None = None
         self._settings: Settings = Settings(settings.root)
 
+    @property
+    def _logger(self) -> Logger:
+        """
+        Obtiene el registro de eventos de la aplicación.
+
+        El registro de eventos se crea la primera vez que se solicita,
+        evitando su construcción cuando la aplicación termina antes de
+        utilizarlo.
+
+        Returns
+        -------
+        Logger
+            El registro de eventos de la aplicación.
+        """
+        if self._cached_logger is None:
+            self._cached_logger = get_logger(pkg_info.name)
+
+        return self._cached_logger
+
     def run(self) -> None:
         """
         Inicia la ejecución de la aplicación.
@@ -109,6 +133,13 @@ class Application:
         dict[str, Any]
             Los argumentos de la aplicación.
         """
+        # Preasignar el diccionario de argumentos con sus claves para
+        # evitar el redimensionamiento al insertar los valores
+
+        args: dict[str, Any] = dict.fromkeys(
+            ("start_time", "end_time", "scan_interval", "station_ids")
+        )
+
         # Fijar valores predeterminados para los parámetros de fecha y
         # hora si no se especificaron
         start_time: datetime
@@ -190,12 +221,12 @@ class Application:
                     "configuración de la aplicación."
                 )
 
-        return {
-            "start_time": start_time,
-            "end_time": end_time,
-            "scan_interval": scan_interval,
-            "station_ids": station_ids,
-        }
+        args["start_time"] = start_time
+        args["end_time"] = end_time
+        args["scan_interval"] = scan_interval
+        args["station_ids"] = station_ids
+
+        return args
 
     def _get_robot(self) -> RobotBasic:
         """
@@ -211,9 +242,7 @@ class Application:
         ValueError
             Si el servicio especificado no está soportado.
         """
-        robots: list[type[RobotBasic]] = [RobotSMN]
-
-        for robot in robots:
+        for robot in self._ROBOTS:
             if self._settings.service == robot.command:
                 return robot(self._settings, self._logger)
 
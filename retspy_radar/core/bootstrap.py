@@ -18,6 +18,8 @@ from .cli_parser import CLINamespace, CLIParser
 
 class Bootstrap:
 
+    __slots__ = ("_settings",)
+
     def __init__(self, settings: SettingsBasic) -> None:
         self._settings: SettingsBasic = settings
 
@@ -211,7 +211,7 @@ class CLIParserBase:
                 dest="station_ids",
                 metavar=cls.ID_STRING,
                 nargs="+",
-                type=set[str],
+                type=str,
                 help=help,
                 default=stations,
             )
@@ -8,6 +8,29 @@ IMAGE_PNG: str = "image/png"
 TEXT_HTML: str = "text/html"
 APPLICATION_JSON: str = "application/json"
 
+# Cabeceras comunes a todas las solicitudes, calculadas una única vez
+# al cargar el módulo en lugar de en cada construcción de cabeceras
+
+USER_AGENT: str = (
+    f"{UAG_NAME}-Indexer/{pkg_info.version} "
+    f"({platform.system()} {os.name.upper()} "
+    f"{platform.release()}/{platform.version()})"
+)
+
+ACCEPT_LANGUAGE: str = (
+    "en-GB;q=0.9,en-US;q=0.8,en;q=0.7,"
+    "es-ES;q=0.8,es-PY;q=0.7,es;q=0.6"
+)
+
+COMMON_HEADERS: dict[str, str] = {
+    "accept-encoding": "gzip, deflate, br, zstd",
+    "accept-language": ACCEPT_LANGUAGE,
+    "cache-control": "no-cache",
+    "connection": "keep-alive",
+    "pragma": "no-cache",
+    "user-agent": USER_AGENT,
+}
+
 
 class Headers:
 
@@ -16,6 +39,7 @@ class Headers:
         referrer: str,
         *,
         accept: str = TEXT_HTML,
+        accept_encoding: str = "",
         authorization: str = "",
     ) -> None:
         """Inicializa una nueva instancia de la clase Headers.
@@ -26,32 +50,24 @@ class Headers:
             El valor de la cabecera "referer".
         accept : str, optional
             El valor de la cabecera "accept", por defecto es "text/html".
+        accept_encoding : str, optional
+            El valor de la cabecera "accept-encoding"; por defecto se
+            negocian las codificaciones de compresión comunes. Los
+            contenidos ya comprimidos, como las imágenes PNG, deben
+            solicitarse con "identity" para no recomprimir en vano.
         authorization : str, optional
             El valor de la cabecera "authorization", por defecto es "".
         """
-        USER_AGENT: str = (
-            f"{UAG_NAME}-Indexer/{pkg_info.version} "
-            f"({platform.system()} {os.name.upper()} "
-            f"{platform.release()}/{platform.version()})"
-        )
-        ACCEPT_LANGUAGE: str = (
-            "en-GB;q=0.9,en-US;q=0.8,en;q=0.7,"
-            "es-ES;q=0.8,es-PY;q=0.7,es;q=0.6"
-        )
-        AUTHORIZATION: dict[str, str] = (
-            {"authorization": authorization} if authorization else {}
-        )
-
-        self._headers: dict[str, str] = {
-            "accept": accept,
-            "accept-encoding": "gzip, deflate, br, zstd",
-            "accept-language": ACCEPT_LANGUAGE,
-            "cache-control": "no-cache",
-            "connection": "keep-alive",
-            "pragma": "no-cache",
-            "referer": referrer,
-            "user-agent": USER_AGENT,
-        } | AUTHORIZATION
+        self._headers: dict[str, str] = dict(COMMON_HEADERS)
+
+        self._headers["accept"] = accept
+        self._headers["referer"] = referrer
+
+        if accept_encoding:
+            self._headers["accept-encoding"] = accept_encoding
+
+        if authorization:
+            self._headers["authorization"] = authorization
 
     @property
     def headers(self) -> dict[str, str]:
@@ -132,7 +132,6 @@ class RobotBasic(RobotBase):
         # el próximo ciclo de recolección de datos
 
         pendent: set[str] = set()
-        retry: set[str] = set()
 
         self._prepare_process()
 
@@ -146,7 +145,7 @@ class RobotBasic(RobotBase):
                     station_ids, API_KEY, access_token
                 )
 
-                pendent = pendent.union(image_set)
+                pendent |= image_set
 
                 # Descargar las imágenes disponibles en el repositorio
                 # remoto y almacenarlas en el repositorio local
@@ -156,20 +155,12 @@ class RobotBasic(RobotBase):
                 )
 
                 # Eliminar las imágenes descargadas del conjunto de
-                # descargas pendientes
-
-                pendent = pendent.difference(downloaded)
-
-                # Si no se pudo descargar una imagen, agregarla al
-                # conjunto de reintentos; si no se pudo descargar una
-                # imagen en el segundo intento, eliminarla de los
-                # conjuntos de reintento y de imágenes pendientes
-
-                for image_name in retry.copy():
-                    retry.remove(image_name)
-                    pendent.remove(image_name)
+                # descargas pendientes; las imágenes que no se pudieron
+                # descargar por errores transitorios se reintentan en
+                # la capa HTTP, y las restantes permanecen pendientes
+                # para el siguiente ciclo
 
-                retry = retry.union(pendent)
+                pendent -= downloaded
 
                 self._prepare_next_cycle()
 
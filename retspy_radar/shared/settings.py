@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any
 
 from ..base.exceptions import ConfigurationFileError
@@ -6,6 +7,11 @@ from ..base.settings import SettingsValue
 
 class Settings:
 
+    # Tamaño mínimo de los fragmentos de descarga; fragmentos menores
+    # multiplican el costo por fragmento del intérprete al descargar
+
+    MIN_CHUNK_SIZE: int = 65536
+
     def __init__(self, settings: SettingsValue) -> None:
         self._settings: SettingsValue = self._validate_ver_1_0(settings)
 
@@ -128,7 +134,7 @@ class Settings:
 
         return service
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         """
         Obtiene la URL de la página inicial del SMN.
@@ -140,7 +146,7 @@ class Settings:
         """
         return self._settings["server"]["base_url"].as_type(str)
 
-    @property
+    @cached_property
     def chunk_size(self) -> int:
         """
         Obtiene el tamaño de los fragmentos de descarga.
@@ -148,11 +154,15 @@ class Settings:
         Returns
         -------
         int
-            El tamaño de los fragmentos de descarga en bytes.
+            El tamaño de los fragmentos de descarga en bytes, nunca
+            menor que `MIN_CHUNK_SIZE`.
         """
-        return self._settings["client"]["chunk_size"].as_type(int)
+        return max(
+            self.MIN_CHUNK_SIZE,
+            self._settings["client"]["chunk_size"].as_type(int),
+        )
 
-    @property
+    @cached_property
     def current_dir(self) -> str:
         """
         Obtiene la ruta del directorio actual.
@@ -164,7 +174,7 @@ class Settings:
         """
         return self._settings["path"]["current_dir"].as_type(str)
 
-    @property
+    @cached_property
     def end_time(self) -> str:
         """
         Obtiene la hora de fin de la recolección de datos.
@@ -177,7 +187,7 @@ class Settings:
         """
         return self._settings["args"]["end_time"].as_type(str)
 
-    @property
+    @cached_property
     def install_dir(self) -> str:
         """
         Obtiene la ruta del directorio actual.
@@ -189,7 +199,7 @@ class Settings:
         """
         return self._settings["path"]["install_dir"].as_type(str)
 
-    @property
+    @cached_property
     def inventory_url(self) -> str:
         """
         Obtiene la URL del conjunto de imágenes disponibles.
@@ -201,7 +211,7 @@ class Settings:
         """
         return self._settings["server"]["inventory_url"].as_type(str)
 
-    @property
+    @cached_property
     def output_dir(self) -> str:
         """
         Obtiene la ruta del directorio de salida de las imágenes.
@@ -213,7 +223,7 @@ class Settings:
         """
         return self._settings["path"]["output_dir"].as_type(str)
 
-    @property
+    @cached_property
     def radar_url(self) -> str:
         """
         Obtiene la URL de la página de imágenes de los radares del
@@ -226,7 +236,7 @@ class Settings:
         """
         return self._settings["server"]["radar_url"].as_type(str)
 
-    @property
+    @cached_property
     def repository_path(self) -> str:
         """
         Obtiene la ruta del directorio de almacenamiento local.
@@ -239,7 +249,7 @@ class Settings:
         """
         return self._settings["client"]["repository_path"].as_type(str)
 
-    @property
+    @cached_property
     def repository_url(self) -> str:
         """
         Obtiene la URL del repositorio de imágenes.
@@ -265,7 +275,7 @@ class Settings:
         # return self._settings["client"]["request_timeout"].as_type(int)
         return 30
 
-    @property
+    @cached_property
     def scan_interval(self) -> str:
         """
         Obtiene el intervalo de tiempo de escaneo de las imágenes.
@@ -278,7 +288,7 @@ class Settings:
         """
         return self._settings["timing"]["scan_interval"].as_type(str)
 
-    @property
+    @cached_property
     def scan_period(self) -> str:
         """
         Obtiene el período de escaneo de las imágenes.
@@ -290,7 +300,7 @@ class Settings:
         """
         return self._settings["args"]["scan_period"].as_type(str)
 
-    @property
+    @cached_property
     def service(self) -> str:
         """
         Obtiene el nombre o identificador del servicio a monitorear.
@@ -302,7 +312,7 @@ class Settings:
         """
         return self._settings["args"]["command"].as_type(str)
 
-    @property
+    @cached_property
     def start_time(self) -> str:
         """
         Obtiene la hora de inicio de la recolección de datos.
@@ -315,7 +325,7 @@ class Settings:
         """
         return self._settings["args"]["start_time"].as_type(str)
 
-    @property
+    @cached_property
     def stations(self) -> dict[str, dict[str, Any]]:
         """
         Obtiene la información de las estaciones disponibles.
@@ -327,7 +337,7 @@ class Settings:
         """
         return self._settings["stations"].as_raw()
 
-    @property
+    @cached_property
     def station_groups(self) -> dict[str, list[str]]:
         """
         Obtiene la información de los grupos de estaciones disponibles.
@@ -339,7 +349,7 @@ class Settings:
         """
         return self._settings["station_groups"].as_raw()
 
-    @property
+    @cached_property
     def station_ids(self) -> list[str]:
         """
         Obtiene los identificadores de las estaciones a escanear.
@@ -351,7 +361,7 @@ class Settings:
         """
         return self._settings["args"]["station_ids"].as_type(list[str])
 
-    @property
+    @cached_property
     def verbosity(self) -> list[str]:
         """
         Obtiene el nivel de verbosidad de los mensajes.
@@ -363,7 +373,7 @@ class Settings:
         """
         return self._settings["args"]["verbosity"].as_type(list[str])
 
-    @property
+    @cached_property
     def wait_for_next_authorization(self) -> str:
         """
         Obtiene el tiempo de espera entre solicitudes de autorización.
@@ -378,7 +388,7 @@ class Settings:
             str
         )
 
-    @property
+    @cached_property
     def wait_for_next_request(self) -> str:
         """
         Obtiene el tiempo de espera entre solicitudes HTTP.
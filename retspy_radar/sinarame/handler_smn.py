@@ -1,10 +1,19 @@
 import re
 from re import Match
-from typing import Any, Iterator
+from typing import Any
 
 from requests import Response
 from requests.exceptions import RequestException
 
+# Utilizar orjson para decodificar las respuestas JSON si está
+# disponible; su decodificador en C es varias veces más rápido que el
+# del módulo json de la biblioteca estándar
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from ..base.exceptions import RequestError, UnexpectedResponseError
 from ..base.requests import RequestsHandlerBase
 from ..shared import APPLICATION_JSON, IMAGE_PNG, TEXT_HTML, Headers, Settings
@@ -32,7 +41,32 @@ class RequestsHandlerSNM(RequestsHandlerBase):
         Obtiene el código de estado de la última solicitud HTTP.
     """
 
-    TOKEN_PATTERN: str = r"localStorage\.setItem\('token',\s*'([^']+)'\);"
+    TOKEN_PATTERN: bytes = rb"localStorage\.setItem\('token',\s*'([^']+)'\);"
+
+    # Patrón compilado una única vez al cargar la clase, para evitar la
+    # búsqueda en la caché de patrones de `re` en cada solicitud; el
+    # patrón opera sobre bytes para explorar los fragmentos de la
+    # respuesta sin decodificarlos
+
+    TOKEN_RE: re.Pattern[bytes] = re.compile(TOKEN_PATTERN)
+
+    # Tamaño de la ventana deslizante de exploración de la respuesta de
+    # autorización; debe ser mayor que el token y su código circundante
+
+    TOKEN_WINDOW_SIZE: int = 8192
+
+    __slots__ = (
+        "_chunk_size",
+        "_image_headers",
+        "_inventory_headers",
+        "_inventory_token",
+        "_inventory_url",
+        "_radar_url",
+        "_repository_url",
+        "_request_timeout",
+        "_settings",
+        "_token_headers",
+    )
 
     def __init__(self, settings: Settings) -> None:
         """
@@ -47,13 +81,40 @@ class RequestsHandlerSNM(RequestsHandlerBase):
 
         self._settings: Settings = settings
 
-    def download_image(self, image_name: str) -> Iterator[Any]:
+        # Fijar los valores de configuración utilizados en cada
+        # solicitud una única vez; la configuración es inmutable tras
+        # la carga, por lo que no hace falta recorrerla en cada llamada
+
+        self._chunk_size: int = settings.chunk_size
+        self._inventory_url: str = settings.inventory_url
+        self._radar_url: str = settings.radar_url
+        self._repository_url: str = settings.repository_url
+        self._request_timeout: int = settings.request_timeout
+
+        # Construir las cabeceras de cada punto de acceso una única
+        # vez; las cabeceras del inventario dependen del token de
+        # autorización y se regeneran sólo cuando éste rota
+
+        self._image_headers: dict[str, str] = Headers(
+            settings.base_url, accept=IMAGE_PNG, accept_encoding="identity"
+        ).headers
+
+        self._token_headers: dict[str, str] = Headers(
+            settings.base_url, accept=TEXT_HTML
+        ).headers
+
+        self._inventory_headers: dict[str, str] = {}
+        self._inventory_token: str = ""
+
+    def download_image(self, image_name: str) -> Response:
         """
         Descarga una imagen de radar.
 
         Realiza una solicitud HTTP al repositorio de imágenes del SMN
-        para descargar una imagen de radar. Los datos de la imagen se
-        devuelven como un iterador.
+        para descargar una imagen de radar. La respuesta se devuelve en
+        modo de flujo, sin haber leído el cuerpo, para que el llamador
+        copie los datos directamente a disco; el llamador es
+        responsable de cerrar la respuesta.
 
         Parameters
         ----------
@@ -62,8 +123,9 @@ class RequestsHandlerSNM(RequestsHandlerBase):
 
         Returns
         -------
-        Iterator[Any]
-            Un iterador con los datos de la imagen.
+        Response
+            La respuesta HTTP en modo de flujo con los datos de la
+            imagen.
 
         Raises
         ------
@@ -73,27 +135,24 @@ class RequestsHandlerSNM(RequestsHandlerBase):
         try:
             # Realizar la solicitud HTTP para descargar la imagen
 
-            request_url: str = f"{self._settings.repository_url}{image_name}"
-
-            request_headers = Headers(
-                self._settings.base_url, accept=IMAGE_PNG
-            )
+            request_url: str = f"{self._repository_url}{image_name}"
 
             response: Response = self.request.get(
                 request_url,
-                headers=request_headers.headers,
-                timeout=self._settings.request_timeout,
+                headers=self._image_headers,
+                timeout=self._request_timeout,
+                stream=True,
             )
 
-            # Devolver los datos de la imagen como un iterador de bytes
-            # por bloques con un tamaño de 1024 bytes
+            # Devolver la respuesta en modo de flujo; con `stream=True`
+            # los datos se leen directamente del socket al copiarlos
 
-            return response.iter_content(self._settings.chunk_size)
+            return response
 
         except RequestException as exc:
             raise RequestError(
                 f"No se pudo descargar la imagen '{image_name}",
-                self.status_code,
+                self._error_status(exc),
             ) from exc
 
     def get_access_token(self) -> str:
@@ -120,33 +179,43 @@ class RequestsHandlerSNM(RequestsHandlerBase):
         try:
             # Realizar la solicitud HTTP para obtener la autorización
 
-            request_url: str = self._settings.radar_url
-
-            request_headers = Headers(
-                self._settings.base_url, accept=TEXT_HTML
-            )
+            request_url: str = self._radar_url
 
             response: Response = self.request.get(
                 request_url,
-                headers=request_headers.headers,
-                timeout=self._settings.request_timeout,
+                headers=self._token_headers,
+                timeout=self._request_timeout,
+                stream=True,
             )
 
-            # Extraer el token de autorización de la respuesta
+            # Explorar la respuesta por fragmentos con una ventana
+            # deslizante para extraer el token de autorización sin
+            # materializar el documento completo, y terminar la
+            # descarga apenas se encuentre el token
 
-            match: Match[str] | None = re.search(
-                self.TOKEN_PATTERN, response.text
-            )
+            try:
+                window: bytes = b""
+
+                for chunk in response.iter_content(self._chunk_size):
+                    window += chunk
 
-            # Si se encontró el token de autorización, devolverlo
+                    match: Match[bytes] | None = self.TOKEN_RE.search(window)
 
-            if match:
-                return match.group(1)
+                    # Si se encontró el token de autorización,
+                    # devolverlo
+
+                    if match:
+                        return match.group(1).decode("ascii")
+
+                    window = window[-self.TOKEN_WINDOW_SIZE :]
+
+            finally:
+                response.close()
 
         except RequestException as exc:
             raise RequestError(
                 "Error al solicitar el código de autorización",
-                self.status_code,
+                self._error_status(exc),
             ) from exc
 
         raise UnexpectedResponseError(
@@ -184,25 +253,35 @@ class RequestsHandlerSNM(RequestsHandlerBase):
             # Realizar la solicitud HTTP para obtener la lista de
             # imágenes
 
-            request_url: str = f"{self._settings.inventory_url}{station_id}"
+            request_url: str = f"{self._inventory_url}{station_id}"
 
-            jwt_auth: str = f"JWT {auth_token}"
+            # Regenerar las cabeceras del inventario sólo cuando rota
+            # el token de autorización
 
-            request_headers = Headers(
-                self._settings.base_url,
-                accept=APPLICATION_JSON,
-                authorization=jwt_auth,
-            )
+            if auth_token != self._inventory_token:
+                self._inventory_headers = Headers(
+                    self._settings.base_url,
+                    accept=APPLICATION_JSON,
+                    authorization=f"JWT {auth_token}",
+                ).headers
+
+                self._inventory_token = auth_token
 
             response: Response = self.request.get(
                 request_url,
-                headers=request_headers.headers,
-                timeout=self._settings.request_timeout,
+                headers=self._inventory_headers,
+                timeout=self._request_timeout,
             )
 
             # Extraer el contenido inventario (JSON) de la respuesta
 
-            content: dict[str, Any] = response.json()
+            content: dict[str, Any]
+
+            if orjson is not None:
+                # pylint: disable-next=no-member
+                content = orjson.loads(response.content)
+            else:
+                content = response.json()
 
             # Extraer la lista de imágenes del contenido
 
@@ -220,7 +299,7 @@ class RequestsHandlerSNM(RequestsHandlerBase):
             raise RequestError(
                 "Error al descargar la lista de imágenes "
                 f"de la estación '{station_id}'",
-                self.status_code,
+                self._error_status(exc),
             ) from exc
 
         raise UnexpectedResponseError(
@@ -1,7 +1,15 @@
+import base64
+import json
+import os
+import shutil
 import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from logging import Logger
 from os import path
-from typing import Any, Iterator
+from typing import Any
+
+from requests import Response
 
 from ..base.exceptions import (
     AuthorizationError,
@@ -10,7 +18,7 @@ from ..base.exceptions import (
     RequestError,
     UnexpectedResponseError,
 )
-from ..base.process import ProcessSleep
+from ..base.process import ProcessSleep, RateLimiter
 from ..base.settings import SettingsBasic
 from ..base.utils import settings_manager as config
 from ..base.utils import timing
@@ -44,6 +52,15 @@ class RobotSMN(RobotBasic):
 
     command: str = app_info.command
 
+    # Número máximo de descargas de imágenes simultáneas
+
+    MAX_DOWNLOAD_WORKERS: int = 8
+
+    # Margen de seguridad, en segundos, antes de la expiración del
+    # token de acceso a partir del cual éste se considera expirado
+
+    TOKEN_EXPIRY_MARGIN: float = 30.0
+
     def __init__(self, settings: Settings, logger: Logger) -> None:
         """
         Inicializa una nueva instancia del indexador de imágenes.
@@ -61,6 +78,52 @@ class RobotSMN(RobotBasic):
         temp_file: str = f"{self.command}.access_key.json"
         self._credentials_path: str = path.join(temp_dir, temp_file)
 
+        # Fijar la ruta del repositorio local una única vez, evitando
+        # recorrer la configuración en cada acceso
+
+        self._repository_path: str = settings.repository_path
+
+        # Crear un único manejador de solicitudes HTTP por robot, para
+        # reutilizar sus conexiones y cabeceras entre llamadas
+
+        self._handler = RequestsHandlerSNM(settings)
+
+        # Crear un único limitador de tasa por robot, compartido por
+        # las solicitudes de inventario y de descarga; así la reducción
+        # de la tasa tras un rechazo del servidor persiste entre ciclos
+        # de recolección en lugar de descartarse en cada llamada
+
+        self._rate_limiter: RateLimiter = self._create_rate_limiter(
+            self.MAX_DOWNLOAD_WORKERS
+        )
+
+    def _create_rate_limiter(self, capacity: float = 1.0) -> RateLimiter:
+        """
+        Crea un limitador de tasa de solicitudes HTTP.
+
+        Crea un limitador de cubeta de fichas cuya tasa de reposición
+        corresponde al tiempo de espera entre solicitudes del archivo
+        de configuración.
+
+        Parameters
+        ----------
+        capacity : float, optional
+            El número máximo de fichas acumulables; determina el tamaño
+            de las ráfagas permitidas, por defecto es 1.
+
+        Returns
+        -------
+        RateLimiter
+            El limitador de tasa de solicitudes.
+        """
+        interval: float = timing.parse_timedelta(
+            self._settings.wait_for_next_request
+        ).seconds
+
+        rate: float = 1.0 / interval if interval > 0.0 else 0.0
+
+        return RateLimiter(rate, capacity)
+
     def _filter_downloaded_images(self, image_set: set[str]) -> set[str]:
         """
         Filtra las imágenes que ya se encuentran en el repositorio.
@@ -78,15 +141,20 @@ class RobotSMN(RobotBasic):
         set[str]
             Un conjunto de identificadores de imágenes pendientes.
         """
-        # Actualizar el conjunto de archivos pendientes, removiendo los
-        # archivos que ya se encuentran en el repositorio local
+        # Enumerar el repositorio local una sola vez y remover del
+        # conjunto los archivos que ya se encuentran en él, en lugar de
+        # consultar el disco una vez por imagen; los archivos parciales
+        # de descargas interrumpidas no cuentan como descargados
         repository_path: str = self._get_repository_path()
 
-        for image_name in image_set.copy():
-            if path.exists(f"{repository_path}{image_name}"):
-                image_set.remove(image_name)
+        with os.scandir(repository_path) as scan:
+            existing: set[str] = {
+                entry.name
+                for entry in scan
+                if not entry.name.endswith(".part")
+            }
 
-        return image_set
+        return image_set - existing
 
     def _finalize_process(self) -> None:
         """
@@ -145,7 +213,10 @@ class RobotSMN(RobotBasic):
             if not renew:
                 token = self._load_token_from_file(self._credentials_path)
 
-                renew = not token
+                # Renovar el token almacenado si falta o si ya expiró,
+                # en lugar de esperar el rechazo 401 del servidor
+
+                renew = not token or self._token_has_expired(token)
 
             if renew:
                 token = self._get_token_from_server(api_key)
@@ -201,35 +272,66 @@ class RobotSMN(RobotBasic):
         """
         # La clave de identificación no se utiliza en esta versión
 
-        wait_for_next_request = ProcessSleep(
-            timing.parse_timedelta(
-                self._settings.wait_for_next_request
-            ).seconds
-        )
+        if not station_ids:
+            return set()
+
+        rate_limiter: RateLimiter = self._rate_limiter
 
-        requests = RequestsHandlerSNM(self._settings)
+        requests: RequestsHandlerSNM = self._handler
 
         image_set: set[str] = set()
 
-        for station_id in station_ids:
-            # Esperar un tiempo para no saturar el servidor y evitar
-            # ser bloqueado, luego obtener la lista de imágenes
-            wait_for_next_request.run()
+        # Obtener las listas de imágenes de las estaciones en paralelo;
+        # las solicitudes son independientes entre sí y comparten el
+        # repositorio de conexiones del manejador
 
-            try:
-                images: set[str] = requests.get_inventory(
-                    station_id, auth_token
+        failures: list[RequestError] = []
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(station_ids), self.MAX_DOWNLOAD_WORKERS)
+        ) as executor:
+            tasks: list[Future[set[str]]] = []
+
+            for station_id in station_ids:
+                # Esperar lo mínimo necesario para no saturar el
+                # servidor, luego encolar la solicitud del inventario
+                rate_limiter.acquire()
+
+                tasks.append(
+                    executor.submit(
+                        requests.get_inventory, station_id, auth_token
+                    )
                 )
 
-                image_set.update(images)
+            for task in as_completed(tasks):
+                try:
+                    image_set.update(task.result())
+
+                except RequestError as exc:
+                    # Reducir el ritmo de solicitudes si el servidor
+                    # rechazó la solicitud por exceso de solicitudes;
+                    # el inventario de la estación se vuelve a pedir
+                    # en el siguiente ciclo, al ritmo reducido
+
+                    if exc.status_code in {429}:
+                        rate_limiter.penalize()
+
+                        self._logger.warning(
+                            "Solicitud de inventario rechazada por "
+                            "exceso de solicitudes."
+                        )
 
-            except RequestError as exc:
-                if exc.status_code in {401}:
-                    raise AuthorizationExpiredError(
-                        "El token de autorización ha expirado"
-                    ) from exc
+                    else:
+                        failures.append(exc)
 
-                raise exc
+        for exc in failures:
+            if exc.status_code in {401}:
+                raise AuthorizationExpiredError(
+                    "El token de autorización ha expirado"
+                ) from exc
+
+        if failures:
+            raise failures[0]
 
         return self._filter_downloaded_images(image_set)
 
@@ -258,43 +360,106 @@ class RobotSMN(RobotBasic):
         """
         # La clave de identificación no se utiliza en esta versión
 
-        wait_for_next_request = ProcessSleep(
-            timing.parse_timedelta(
-                self._settings.wait_for_next_request
-            ).seconds
-        )
+        if not image_set:
+            return set()
+
+        rate_limiter: RateLimiter = self._rate_limiter
 
-        requests = RequestsHandlerSNM(self._settings)
+        requests: RequestsHandlerSNM = self._handler
 
-        pendent_set: set[str] = image_set.copy()
+        downloaded: list[str] = []
 
-        self._logger.info(f"Descargando {len(image_set)} nuevas imágenes.")
+        self._logger.info("Descargando %d nuevas imágenes.", len(image_set))
 
-        for image_name in image_set:
-            # Esperar un tiempo para no saturar el servidor y evitar ser
-            # bloqueado, luego descargar y guardar cada imagen pendiente
-            wait_for_next_request.run()
+        # Descargar y guardar las imágenes pendientes con un número
+        # acotado de descargas simultáneas; el ritmo de envío de las
+        # solicitudes se regula desde el hilo principal para no saturar
+        # el servidor y evitar ser bloqueado
 
-            try:
-                image_data: Iterator[Any] = requests.download_image(image_name)
+        failures: list[RequestError] = []
 
-                pendent_set.remove(image_name)
+        with ThreadPoolExecutor(
+            max_workers=self.MAX_DOWNLOAD_WORKERS
+        ) as executor:
+            tasks: dict[Future[None], str] = {}
 
-                self._save_image(image_name, image_data)
+            for image_name in image_set:
+                # Esperar lo mínimo necesario antes de encolar la
+                # descarga y el guardado de cada imagen pendiente
+                rate_limiter.acquire()
 
-                self._logger.info(
-                    f"Imagen '{image_name}' descargada exitosamente."
+                task: Future[None] = executor.submit(
+                    self._download_and_save, requests, image_name
                 )
 
-            except RequestError as exc:
-                if exc.status_code in {401}:
-                    raise AuthorizationExpiredError(
-                        "El token de autorización ha expirado"
-                    ) from exc
+                tasks[task] = image_name
+
+            for task in as_completed(tasks):
+                image_name = tasks[task]
+
+                try:
+                    task.result()
+
+                    downloaded.append(image_name)
+
+                    rate_limiter.reward()
+
+                    self._logger.info(
+                        "Imagen '%s' descargada exitosamente.", image_name
+                    )
+
+                except RequestError as exc:
+                    # Reducir el ritmo de solicitudes si el servidor
+                    # rechazó la solicitud por exceso de solicitudes;
+                    # la imagen queda pendiente y se reintenta en el
+                    # siguiente ciclo, al ritmo reducido
 
-                raise exc
+                    if exc.status_code in {429}:
+                        rate_limiter.penalize()
 
-        return image_set - pendent_set
+                        self._logger.warning(
+                            "Descarga de la imagen '%s' rechazada por "
+                            "exceso de solicitudes.",
+                            image_name,
+                        )
+
+                    else:
+                        failures.append(exc)
+
+        for exc in failures:
+            if exc.status_code in {401}:
+                raise AuthorizationExpiredError(
+                    "El token de autorización ha expirado"
+                ) from exc
+
+        if failures:
+            raise failures[0]
+
+        return set(downloaded)
+
+    def _download_and_save(
+        self, requests: RequestsHandlerSNM, image_name: str
+    ) -> None:
+        """
+        Descarga una imagen y la guarda en el repositorio local.
+
+        Rutina ejecutada por los hilos de descarga de imágenes.
+
+        Parameters
+        ----------
+        requests : RequestsHandlerSNM
+            El manejador de solicitudes HTTP.
+        image_name : str
+            El nombre de la imagen a descargar.
+
+        Raises
+        ------
+        RequestError
+            Si hubo un error al realizar la solicitud HTTP.
+        """
+        image_data: Response = requests.download_image(image_name)
+
+        self._save_image(image_name, image_data)
 
     def _get_repository_path(self) -> str:
         """
@@ -308,7 +473,7 @@ class RobotSMN(RobotBasic):
         str
             La ruta del repositorio de datos.
         """
-        return self._settings.repository_path
+        return self._repository_path
 
     def _get_token_from_server(
         self, api_key: str  # pylint: disable=unused-argument
@@ -337,9 +502,7 @@ class RobotSMN(RobotBasic):
         """
         # La clave de identificación no se utiliza en esta versión
 
-        requests = RequestsHandlerSNM(self._settings)
-
-        return requests.get_access_token()
+        return self._handler.get_access_token()
 
     @staticmethod
     def _load_token_from_file(credentials_path: str) -> str:
@@ -378,6 +541,48 @@ class RobotSMN(RobotBasic):
                 "El archivo de credenciales no contiene un token de acceso"
             ) from exc
 
+    @classmethod
+    def _token_has_expired(cls, token: str) -> bool:
+        """
+        Verifica si un token de acceso ha expirado.
+
+        Decodifica la carga útil del token JWT y compara su
+        reivindicación de expiración («exp») con la hora actual, con un
+        margen de seguridad de `TOKEN_EXPIRY_MARGIN` segundos.
+
+        Parameters
+        ----------
+        token : str
+            El token de acceso a verificar.
+
+        Returns
+        -------
+        bool
+            `True` si el token expiró o está por expirar, `False` si
+            sigue vigente o no declara una fecha de expiración.
+        """
+        try:
+            payload_b64: str = token.split(".")[1]
+
+            # Reponer el relleno de la codificación base64url
+
+            payload_b64 += "=" * (-len(payload_b64) % 4)
+
+            payload: dict[str, Any] = json.loads(
+                base64.urlsafe_b64decode(payload_b64)
+            )
+
+            expiry = float(payload["exp"])
+
+        except (IndexError, KeyError, TypeError, ValueError):
+            # Si no es posible extraer la expiración del token, no se
+            # puede anticipar su vencimiento; se detectará mediante la
+            # respuesta 401 del servidor
+
+            return False
+
+        return time.time() >= expiry - cls.TOKEN_EXPIRY_MARGIN
+
     def _prepare_next_cycle(self) -> None:
         """
         Prepara el siguiente ciclo de recolección de datos.
@@ -396,20 +601,25 @@ class RobotSMN(RobotBasic):
         """
         self._logger.info("Preparando el proceso de recolección de datos.")
 
-    def _save_image(self, image_name: str, image_data: Iterator[Any]) -> None:
+    def _save_image(self, image_name: str, image_data: Response) -> None:
         """
         Guarda una imagen de radar en el repositorio local.
 
         Guarda una imagen de radar en el repositorio local especificado
         por la ruta del repositorio local. Los datos de la imagen se
-        guardan en disco con el nombre de la imagen.
+        copian a disco directamente desde el flujo de la respuesta
+        HTTP, que se cierra al finalizar la copia. La imagen se escribe
+        en un archivo temporal que se renombra atómicamente al nombre
+        final, para que el repositorio nunca contenga imágenes
+        truncadas por una descarga interrumpida.
 
         Parameters
         ----------
         image_name : str
             El nombre de la imagen a guardar.
-        data : Iterator[Any]
-            Los datos de la imagen.
+        image_data : Response
+            La respuesta HTTP en modo de flujo con los datos de la
+            imagen.
 
         Raises
         ------
@@ -417,17 +627,38 @@ class RobotSMN(RobotBasic):
             Si hubo un error al guardar la imagen en disco.
         """
         try:
-            repository_path: str = self._get_repository_path()
+            image_path: str = path.join(
+                self._get_repository_path(), image_name
+            )
+
+            partial_path: str = f"{image_path}.part"
 
-            image_path: str = f"{repository_path}{image_name}"
+            # Copiar la imagen del flujo de la respuesta al disco; la
+            # copia por bloques se realiza en código C, sin iterar los
+            # fragmentos en el intérprete, y con un búfer de escritura
+            # amplio para reducir el número de escrituras a disco
 
-            # Guardar la imagen en el disco
-            with open(image_path, "wb") as file:
-                for chunk in image_data:
-                    file.write(chunk)
+            image_data.raw.decode_content = True
+
+            with open(partial_path, "wb", buffering=1 << 20) as file:
+                shutil.copyfileobj(
+                    image_data.raw, file, self._settings.chunk_size
+                )
+
+                file.flush()
+                os.fsync(file.fileno())
+
+            # Publicar la imagen con un renombrado atómico; si la copia
+            # se interrumpe, sólo queda el archivo parcial, que no se
+            # cuenta como imagen descargada
+
+            os.replace(partial_path, image_path)
 
         except (IOError, OSError, TypeError) as exc:
-            print(f"Error al guardar la imagen: {exc}")
+            self._logger.error("Error al guardar la imagen: %s.", exc)
+
+        finally:
+            image_data.close()
 
     @staticmethod
     def _save_token_to_file(credentials_path: str, token: str) -> None: